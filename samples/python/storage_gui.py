@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import ipywidgets as ipw
 import ipysheet as ips
 from cmdty_storage import CmdtyStorage, three_factor_seasonal_value, MultiFactorModel, multi_factor
@@ -7,7 +8,7 @@ from datetime import date, timedelta
 from IPython.display import display
 from ipywidgets.widgets.interaction import show_inline_matplotlib_plots
 from collections import namedtuple
-import itertools
+import functools
 import logging
 
 # Set up logging
@@ -79,23 +80,47 @@ def create_tab(titles, children):
     tab.children = children
     return tab
 
+def create_blank_sheet(rows, column_headers, column_types):
+    # Build all the Cell widgets upfront and attach them to the sheet in a single assignment.
+    # Calling ips.cell per cell re-sends the sheet's whole cell collection to the browser on
+    # every call, which makes sheet construction quadratic in the number of cells.
+    sheet = ips.sheet(rows=rows, columns=len(column_headers), column_headers=column_headers)
+    cells = []
+    for row_num in range(rows):
+        for col_num, col_type in enumerate(column_types):
+            cells.append(ips.Cell(value='', row_start=row_num, row_end=row_num, column_start=col_num,
+                                  column_end=col_num, type=col_type, date_format=date_format,
+                                  numeric_format='0.000', squeeze_row=True, squeeze_column=True))
+    sheet.cells = cells
+    return sheet
+
 def enumerate_ratchets():
-    ratchet_row = 0
-    while ratchet_row < num_ratch_rows and ratch_input_sheet[ratchet_row, 1].value != '':
-        yield RatchetRow(ratch_input_sheet[ratchet_row, 0].value, ratch_input_sheet[ratchet_row, 1].value,
-                        ratch_input_sheet[ratchet_row, 3].value, ratch_input_sheet[ratchet_row, 2].value)
-        ratchet_row+=1
+    # Read the sheet contents in one go, rather than cell-by-cell which incurs a widget
+    # round-trip for every cell
+    ratch_df = ips.to_dataframe(ratch_input_sheet)
+    ratch_df = ratch_df[ratch_df['inventory'] != '']
+    for row in ratch_df.itertuples(index=False):
+        yield RatchetRow(row.date, row.inventory, row.withdraw_rate, row.inject_rate)
 
 def read_ratchets():
-    ratchets = []
-    for ratch in enumerate_ratchets():
+    # Gather the ratchet table into a numpy structured array in a single pass, with blank-date
+    # continuation rows carrying the ordinal of the preceding dated row, then group on the
+    # ordinals with array operations
+    rows = list(enumerate_ratchets())
+    ratch_arr = np.zeros(len(rows), dtype=[('date_ord', 'i8'), ('inventory', 'f8'),
+                                           ('min_rate', 'f8'), ('max_rate', 'f8')])
+    date_ord = None
+    for i, ratch in enumerate(rows):
         if ratch.date != '':
-            dt_item = (pd.Period(ratch.date, freq=freq), [(ratch.inventory, -ratch.inject_rate,
-                                                        ratch.withdraw_rate)])
-            ratchets.append(dt_item)
-        else:
-            dt_item[1].append((ratch.inventory, -ratch.inject_rate,
-                                                        ratch.withdraw_rate))
+            date_ord = pd.Period(ratch.date, freq=freq).ordinal
+        ratch_arr[i] = (date_ord, ratch.inventory, -ratch.inject_rate, ratch.withdraw_rate)
+    ratchets = []
+    unique_ords, first_indices = np.unique(ratch_arr['date_ord'], return_index=True)
+    for idx in np.argsort(first_indices):
+        block = ratch_arr[ratch_arr['date_ord'] == unique_ords[idx]]
+        period = pd.Period(ordinal=int(unique_ords[idx]), freq=freq)
+        ratchets.append((period, list(zip(block['inventory'].tolist(), block['min_rate'].tolist(),
+                                          block['max_rate'].tolist()))))
     return ratchets
 
 val_date_wgt = ipw.DatePicker(description='Val Date', value=date.today())
@@ -105,10 +130,7 @@ discount_deltas_wgt = ipw.Checkbox(description='Discount Deltas', value=False)
 val_inputs_wgt = ipw.VBox([val_date_wgt, inventory_wgt, ir_wgt, discount_deltas_wgt])
 
 # Forward curve
-fwd_input_sheet = ips.sheet(rows=num_fwd_rows, columns=2, column_headers=['fwd_start', 'price'])
-for row_num in range(0, num_fwd_rows):
-    ips.cell(row_num, 0, '', date_format=date_format, type='date')
-    ips.cell(row_num, 1, '', type='numeric')
+fwd_input_sheet = create_blank_sheet(num_fwd_rows, ['fwd_start', 'price'], ['date', 'numeric'])
 
 out_fwd_curve = ipw.Output()
 smooth_curve_wgt = ipw.Checkbox(description='Apply Smoothing', value=False)
@@ -160,13 +182,8 @@ storage_simple_wgt = ipw.VBox([invent_min_wgt, invent_max_wgt, inj_rate_wgt, wit
 
 # Ratchet storage type properties
 
-ratch_input_sheet = ips.sheet(rows=num_ratch_rows, columns=4, 
-                              column_headers=['date', 'inventory', 'inject_rate', 'withdraw_rate'])
-for row_num in range(0, num_ratch_rows):
-    ips.cell(row_num, 0, '', date_format=date_format, type='date')
-    ips.cell(row_num, 1, '', type='numeric')
-    ips.cell(row_num, 2, '', type='numeric')
-    ips.cell(row_num, 3, '', type='numeric')
+ratch_input_sheet = create_blank_sheet(num_ratch_rows, ['date', 'inventory', 'inject_rate', 'withdraw_rate'],
+                                       ['date', 'numeric', 'numeric', 'numeric'])
 
 # Compose storage
 storage_details_wgt = ipw.VBox([storage_common_wgt, storage_simple_wgt])
@@ -270,26 +287,46 @@ def on_progress(progress):
 def twentieth_of_next_month(period): return period.asfreq('M').asfreq('D', 'end') + 20
 
 def read_fwd_curve():
-    fwd_periods = []
-    fwd_prices = []
-    fwd_row = 0
-    while fwd_input_sheet[fwd_row, 0].value != '':
-        fwd_periods.append(pd.Period(fwd_input_sheet[fwd_row, 0].value, freq=freq))
-        fwd_prices.append(fwd_input_sheet[fwd_row, 1].value)
-        fwd_row += 1
+    # Read the sheet contents in one go, rather than cell-by-cell which incurs a widget
+    # round-trip for every cell
+    fwd_df = ips.to_dataframe(fwd_input_sheet)
+    fwd_df = fwd_df[fwd_df['fwd_start'] != '']
+    fwd_periods = pd.PeriodIndex(fwd_df['fwd_start'].to_numpy(), freq=freq)
+    fwd_prices = fwd_df['price'].to_numpy(dtype='float64')
     if smooth_curve_wgt.value:
-        p1, p2 = itertools.tee(fwd_periods)
-        next(p2, None)
-        contracts = []
-        for start, end, price in zip(p1, p2, fwd_prices):
-            contracts.append((start, end - 1, price))
+        contracts = [(start, end - 1, price)
+                     for start, end, price in zip(fwd_periods[:-1], fwd_periods[1:], fwd_prices)]
         weekend_adjust = None
         if apply_wkend_shaping_wgt.value:
             wkend_factor = wkend_factor_wgt.value
             weekend_adjust = adjustments.dayofweek(default=1.0, saturday=wkend_factor, sunday=wkend_factor)
         return max_smooth_interp(contracts, freq=freq, mult_season_adjust=weekend_adjust)
     else:
-        return pd.Series(fwd_prices, pd.PeriodIndex(fwd_periods)).resample(freq).fillna('pad')
+        # Forward-fill onto the valuation granularity with a single vectorised searchsorted on
+        # the period ordinals, which is much quicker than resample(freq).ffill()
+        curve_periods = pd.period_range(fwd_periods[0], fwd_periods[-1], freq=freq)
+        fill_indices = np.searchsorted(fwd_periods.asi8, curve_periods.asi8, side='right') - 1
+        return pd.Series(fwd_prices[fill_indices], curve_periods)
+
+# Building CmdtyStorage runs the .NET builder pipeline over every period of the storage life, so
+# memoise construction on the defining inputs. Repeated Calculate presses which only tweak the
+# simulation or model widgets then reuse the storage built on a previous press.
+@functools.lru_cache(maxsize=4)
+def build_simple_storage(storage_start, storage_end, injection_cost, withdrawal_cost, min_inventory,
+                         max_inventory, max_injection_rate, max_withdrawal_rate, cmdty_consumed_inject,
+                         cmdty_consumed_withdraw):
+    return CmdtyStorage(freq, storage_start=storage_start, storage_end=storage_end,
+                        injection_cost=injection_cost, withdrawal_cost=withdrawal_cost,
+                        min_inventory=min_inventory, max_inventory=max_inventory,
+                        max_injection_rate=max_injection_rate, max_withdrawal_rate=max_withdrawal_rate,
+                        cmdty_consumed_inject=cmdty_consumed_inject,
+                        cmdty_consumed_withdraw=cmdty_consumed_withdraw)
+
+@functools.lru_cache(maxsize=4)
+def build_ratchet_storage(storage_start, storage_end, injection_cost, withdrawal_cost, ratchets):
+    return CmdtyStorage(freq, storage_start=storage_start, storage_end=storage_end,
+                        injection_cost=injection_cost, withdrawal_cost=withdrawal_cost,
+                        constraints=ratchets)
 
 def btn_clicked(b):
     progress_wgt.value = 0.0
@@ -306,23 +343,24 @@ def btn_clicked(b):
         global storage
         global val_results_3f
         if stor_type_wgt.value == 'Simple':
-            storage = CmdtyStorage(freq, storage_start=start_wgt.value, storage_end=end_wgt.value, 
-                                   injection_cost=inj_cost_wgt.value, withdrawal_cost=with_cost_wgt.value,
-                                  min_inventory=invent_min_wgt.value, max_inventory=invent_max_wgt.value,
-                                  max_injection_rate=inj_rate_wgt.value, max_withdrawal_rate=with_rate_wgt.value,
-                                  cmdty_consumed_inject=inj_consumed_wgt.value, 
-                                  cmdty_consumed_withdraw=with_consumed_wgt.value)
+            storage = build_simple_storage(start_wgt.value, end_wgt.value, inj_cost_wgt.value,
+                                           with_cost_wgt.value, invent_min_wgt.value, invent_max_wgt.value,
+                                           inj_rate_wgt.value, with_rate_wgt.value, inj_consumed_wgt.value,
+                                           with_consumed_wgt.value)
+        else:
+            # Nested tuples so the ratchets are hashable as part of the cache key
+            ratchets = tuple((period, tuple(rates)) for period, rates in read_ratchets())
+            storage = build_ratchet_storage(start_wgt.value, end_wgt.value, inj_cost_wgt.value,
+                                            with_cost_wgt.value, ratchets)
+
+        interest_rate_index = pd.period_range(val_date_wgt.value,
+                                  twentieth_of_next_month(pd.Period(end_wgt.value, freq='D')), freq='D')
+        interest_rate_curve = pd.Series(np.full(len(interest_rate_index), ir_wgt.value), interest_rate_index)
+        if seed_is_random_wgt.value:
+            seed, spawned_fwd_sim_seed = multi_factor.spawn_sim_seeds()
         else:
-            ratchets = read_ratchets()
-            storage = CmdtyStorage(freq, storage_start=start_wgt.value, storage_end=end_wgt.value, 
-                       injection_cost=inj_cost_wgt.value, withdrawal_cost=with_cost_wgt.value,
-                       constraints=ratchets)
-
-        interest_rate_curve = pd.Series(index=pd.period_range(val_date_wgt.value, 
-                                  twentieth_of_next_month(pd.Period(end_wgt.value, freq='D')), freq='D'), dtype='float64')
-        interest_rate_curve[:] = ir_wgt.value
-        seed = None if seed_is_random_wgt.value else random_seed_wgt.value
-        fwd_sim_seed = fwd_sim_seed_wgt.value if fwd_sim_seed_set_wgt.value else None
+            seed, spawned_fwd_sim_seed = random_seed_wgt.value, None
+        fwd_sim_seed = fwd_sim_seed_wgt.value if fwd_sim_seed_set_wgt.value else spawned_fwd_sim_seed
         logger.info('Valuation started.')
         val_results_3f = three_factor_seasonal_value(storage, val_date_wgt.value, inventory_wgt.value, fwd_curve=fwd_curve,
                                      interest_rates=interest_rate_curve, settlement_rule=twentieth_of_next_month,
@@ -23,7 +23,6 @@
 
 import clr
 import System as dotnet
-import System.Collections.Generic as dotnet_cols_gen
 from pathlib import Path
 
 clr.AddReference(str(Path('cmdty_storage/lib/Cmdty.Storage')))
@@ -31,6 +30,7 @@ import Cmdty.Storage as net_cs
 
 from typing import Union, Callable, Iterable, Tuple, NamedTuple
 from datetime import datetime, date
+import numpy as np
 import pandas as pd
 from cmdty_storage import utils
 
@@ -76,20 +76,31 @@ class CmdtyStorage:
 
         builder = builder.WithActiveTimePeriod(start_period, end_period)
 
-        net_constraints = dotnet_cols_gen.List[net_cs.InjectWithdrawRangeByInventoryAndPeriod[time_period_type]]()
-
         if constraints is not None:
             utils.raise_if_not_none(min_inventory, "min_inventory parameter should not be provided if constraints parameter is provided.")
             utils.raise_if_not_none(max_inventory, "max_inventory parameter should not be provided if constraints parameter is provided.")
             utils.raise_if_not_none(max_injection_rate, "max_injection_rate parameter should not be provided if constraints parameter is provided.")
             utils.raise_if_not_none(max_withdrawal_rate, "max_withdrawal_rate parameter should not be provided if constraints parameter is provided.")
 
+            flat_period_ticks = []
+            flat_inventories = []
+            flat_min_rates = []
+            flat_max_rates = []
             for period, rates_by_inventory in constraints:
-                net_period = utils.from_datetime_like(period, time_period_type)
-                net_rates_by_inventory = dotnet_cols_gen.List[net_cs.InjectWithdrawRangeByInventory]()
+                net_ticks = utils.py_date_like_to_net_ticks(period)
                 for inventory, min_rate, max_rate in rates_by_inventory:
-                    net_rates_by_inventory.Add(net_cs.InjectWithdrawRangeByInventory(inventory, net_cs.InjectWithdrawRange(min_rate, max_rate)))
-                net_constraints.Add(net_cs.InjectWithdrawRangeByInventoryAndPeriod[time_period_type](net_period, net_rates_by_inventory))
+                    flat_period_ticks.append(net_ticks)
+                    flat_inventories.append(inventory)
+                    flat_min_rates.append(min_rate)
+                    flat_max_rates.append(max_rate)
+
+            # Pass the flattened ratchet table as four bulk-copied arrays and group it back into nested
+            # collections in managed code, rather than making several CLR calls per constraint row
+            net_constraints = net_cs.CmdtyStorageBuilderExtensions.BuildInjectWithdrawRangesFromArrays[time_period_type](
+                utils.as_net_array(np.asarray(flat_period_ticks, dtype=np.int64)),
+                utils.as_net_array(np.asarray(flat_inventories, dtype=np.float64)),
+                utils.as_net_array(np.asarray(flat_min_rates, dtype=np.float64)),
+                utils.as_net_array(np.asarray(flat_max_rates, dtype=np.float64)))
 
             builder = net_cs.IAddInjectWithdrawConstraints[time_period_type](builder)
             net_cs.CmdtyStorageBuilderExtensions.WithTimeAndInventoryVaryingInjectWithdrawRatesPiecewiseLinear[time_period_type](builder, net_constraints)
@@ -197,10 +208,13 @@ class CmdtyStorage:
 
         self._net_storage = net_cs.IBuildCmdtyStorage[time_period_type](builder).Build()
         self._freq = freq
+        # Cache conversions which would otherwise be repeated on every method call or property access
+        self._time_period_type = time_period_type
+        self._start = utils.net_time_period_to_pandas_period(self._net_storage.StartPeriod, freq)
+        self._end = utils.net_time_period_to_pandas_period(self._net_storage.EndPeriod, freq)
 
     def _net_time_period(self, period):
-        time_period_type = utils.FREQ_TO_PERIOD_TYPE[self._freq]
-        return utils.from_datetime_like(period, time_period_type)
+        return utils.from_datetime_like(period, self._time_period_type)
 
     @property
     def net_storage(self) -> net_cs.CmdtyStorage:
@@ -216,11 +230,11 @@ class CmdtyStorage:
 
     @property
     def start(self) -> pd.Period:
-        return utils.net_time_period_to_pandas_period(self._net_storage.StartPeriod, self._freq)
+        return self._start
 
     @property
     def end(self) -> pd.Period:
-        return utils.net_time_period_to_pandas_period(self._net_storage.EndPeriod, self._freq)
+        return self._end
 
     def inject_withdraw_range(self, period, inventory) -> InjectWithdrawRange:
 
@@ -59,7 +59,8 @@ def intrinsic_value(cmdty_storage: CmdtyStorage,
     time_period_type = utils.FREQ_TO_PERIOD_TYPE[cmdty_storage.freq]
     current_period = utils.from_datetime_like(val_date, time_period_type)
     net_forward_curve = utils.series_to_double_time_series(forward_curve, time_period_type)
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq,
+                                                       periods=forward_curve.index)
     interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
     return net_intrinsic_calc(cmdty_storage, current_period, interest_rate_time_series, inventory, net_forward_curve,
                                  net_settlement_rule, num_inventory_grid_points, numerical_tolerance, time_period_type)
@@ -70,8 +70,10 @@ class MultiFactorSpotSim:
         net_forward_curve = utils.curve_to_net_dict(fwd_curve, time_period_type)
         net_current_date = utils.py_date_like_to_net_datetime(current_date)
         net_time_func = dotnet.Func[dotnet.DateTime, dotnet.DateTime, dotnet.Double](net_sim.TimeFunctions.Act365)
-        net_sim_periods = dotnet_cols_gen.List[time_period_type]()
-        [net_sim_periods.Add(utils.from_datetime_like(p, time_period_type)) for p in sim_periods]
+        sim_period_index = pd.PeriodIndex([_to_pd_period(freq, p) for p in sim_periods], freq=freq)
+        net_sim_periods = dotnet_cols_gen.List[time_period_type](len(sim_period_index))
+        for net_period in utils.index_to_net_time_periods(sim_period_index, time_period_type):
+            net_sim_periods.Add(net_period)
 
         if seed is None:
             mt_rand = net_sim.MersenneTwisterGenerator(antithetic)
@@ -81,7 +83,7 @@ class MultiFactorSpotSim:
 
         self._net_simulator = net_sim.MultiFactor.MultiFactorSpotPriceSimulator[time_period_type](
             net_multi_factor_params, net_current_date, net_forward_curve, net_sim_periods, net_time_func, mt_rand)
-        self._sim_periods = [_to_pd_period(freq, p) for p in sim_periods]
+        self._sim_periods = sim_period_index
         self._freq = freq
 
     def simulate(self, num_sims: int) -> pd.DataFrame:
@@ -99,7 +101,7 @@ def _to_pd_period(freq: str, date_like: tp.Union[pd.Period, datetime, date, str]
 
 
 def _create_net_multi_factor_params(factor_corrs, factors, time_period_type):
-    net_factors = dotnet_cols_gen.List[net_sim.MultiFactor.Factor[time_period_type]]()
+    net_factors = dotnet_cols_gen.List[net_sim.MultiFactor.Factor[time_period_type]](len(factors))
     for mean_reversion, vol_curve in factors:
         net_vol_curve = utils.curve_to_net_dict(vol_curve, time_period_type)
         net_factors.Add(net_sim.MultiFactor.Factor[time_period_type](mean_reversion, net_vol_curve))
@@ -351,7 +353,7 @@ def three_factor_seasonal_value(cmdty_storage: CmdtyStorage,
     return _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                                   num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                                   basis_func_transformed, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                                  val_date, discount_deltas, extra_decisions)
+                                  net_current_period, discount_deltas, extra_decisions)
 
 
 def multi_factor_value(cmdty_storage: CmdtyStorage,
@@ -377,29 +379,59 @@ def multi_factor_value(cmdty_storage: CmdtyStorage,
         raise ValueError("cmdty_storage and forward_curve have different frequencies.")
     time_period_type = utils.FREQ_TO_PERIOD_TYPE[cmdty_storage.freq]
     net_multi_factor_params = _create_net_multi_factor_params(factor_corrs, factors, time_period_type)
+    net_current_period = utils.from_datetime_like(val_date, time_period_type)
     return _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                                   num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                                   basis_funcs, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                                  val_date, discount_deltas, extra_decisions)
+                                  net_current_period, discount_deltas, extra_decisions)
+
+
+def spawn_sim_seeds(seed: tp.Optional[int] = None) -> tp.Tuple[int, int]:
+    """Derives independent seeds for the regression and valuation simulations.
+
+    Uses numpy's SeedSequence counter-based stream splitting, so a single entropy value (or OS
+    entropy if seed is None) produces two collision-resistant streams. This gives statistically
+    independent regression and valuation simulations without having to hand-pick two seed values.
+    The returned seeds are 31-bit, as required by the .NET random generators."""
+    regress_seq, valuation_seq = np.random.SeedSequence(seed).spawn(2)
+    regress_seed = int(regress_seq.generate_state(1)[0] >> 1)
+    valuation_seed = int(valuation_seq.generate_state(1)[0] >> 1)
+    return regress_seed, valuation_seed
+
+
+_parsed_basis_funcs_cache = {}
+
+
+def _parse_basis_funcs(basis_funcs: str):
+    """Parses and compiles a basis function expression, caching by expression string.
+
+    Compilation takes a few seconds and the same expression is typically reused across repeated
+    valuations, so the compiled .NET basis functions are only built on the first call for each
+    distinct expression."""
+    net_basis_functions = _parsed_basis_funcs_cache.get(basis_funcs)
+    if net_basis_functions is None:
+        logger.info('Compiling basis functions. Takes a few seconds on the first run.')
+        net_basis_functions = net_cs.BasisFunctionsBuilder.Parse(basis_funcs)
+        logger.info('Compilation of basis functions complete.')
+        _parsed_basis_funcs_cache[basis_funcs] = net_basis_functions
+    return net_basis_functions
 
 
 def _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                            num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                            basis_funcs, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                           val_date, discount_deltas, extra_decisions):
+                           net_current_period, discount_deltas, extra_decisions):
     # Convert inputs to .NET types
     net_forward_curve = utils.series_to_double_time_series(fwd_curve, time_period_type)
-    net_current_period = utils.from_datetime_like(val_date, time_period_type)
     net_grid_calc = net_cs.FixedSpacingStateSpaceGridCalc.CreateForFixedNumberOfPointsOnGlobalInventoryRange[
         time_period_type](cmdty_storage.net_storage, num_inventory_grid_points)
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq,
+                                                       periods=fwd_curve.index)
     net_interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
     net_discount_func = net_cs.StorageHelper.CreateAct65ContCompDiscounterFromSeries(net_interest_rate_time_series)
     net_on_progress = utils.wrap_on_progress_for_dotnet(on_progress_update)
 
-    logger.info('Compiling basis functions. Takes a few seconds on the first run.')
-    net_basis_functions = net_cs.BasisFunctionsBuilder.Parse(basis_funcs)
-    logger.info('Compilation of basis functions complete.')
+    net_basis_functions = _parse_basis_funcs(basis_funcs)
 
     # Intrinsic calc
     logger.info('Calculating intrinsic value.')
@@ -70,7 +70,8 @@ def trinomial_value(cmdty_storage: CmdtyStorage,
     net_cs.TreeStorageValuationExtensions.WithOneFactorTrinomialTree[time_period_type](
         trinomial_calc, net_spot_volatility, mean_reversion, time_step)
 
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq,
+                                                       periods=forward_curve.index)
     net_cs.ITreeAddCmdtySettlementRule[time_period_type](trinomial_calc).WithCmdtySettlementRule(net_settlement_rule)
 
     interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
@@ -45,10 +45,23 @@ import typing as tp
 import re
 
 
+_from_date_time_cache = {}
+
+
+def _from_date_time_factory(time_period_type):
+    """Returns the FromDateTime factory method closed over time_period_type, cached because the
+    pythonnet generic method binding is reflection-based and relatively slow."""
+    factory = _from_date_time_cache.get(time_period_type)
+    if factory is None:
+        factory = net_tp.TimePeriodFactory.FromDateTime[time_period_type]
+        _from_date_time_cache[time_period_type] = factory
+    return factory
+
+
 def from_datetime_like(datetime_like: tp.Union[datetime, date, str, pd.Period], time_period_type):
     """ Converts either a pandas Period, str, datetime or date to a .NET Time Period"""
     date_time = py_date_like_to_net_datetime(datetime_like)
-    return net_tp.TimePeriodFactory.FromDateTime[time_period_type](date_time)
+    return _from_date_time_factory(time_period_type)(date_time)
 
 
 def py_date_like_to_net_datetime(datetime_like: tp.Union[datetime, date, str, pd.Period]):
@@ -62,6 +75,23 @@ def py_date_like_to_net_datetime(datetime_like: tp.Union[datetime, date, str, pd
     return dotnet.DateTime(datetime_like.year, datetime_like.month, datetime_like.day, *time_args)
 
 
+_NET_DATE_TIME_EPOCH = datetime(1, 1, 1)
+_NET_TICKS_PER_SECOND = 10000000
+
+
+def py_date_like_to_net_ticks(datetime_like: tp.Union[datetime, date, str, pd.Period]) -> int:
+    """Converts either a pandas Period, str, datetime or date to the Ticks integer of the equivalent .NET DateTime."""
+    if isinstance(datetime_like, str):
+        datetime_like = dateutil.parser.parse(datetime_like)
+    if hasattr(datetime_like, 'hour'):
+        time_args = (datetime_like.hour, datetime_like.minute, datetime_like.second)
+    else:
+        time_args = (0, 0, 0)
+    time_delta = datetime(datetime_like.year, datetime_like.month, datetime_like.day, *time_args) \
+                 - _NET_DATE_TIME_EPOCH
+    return (time_delta.days * 86400 + time_delta.seconds) * _NET_TICKS_PER_SECOND + time_delta.microseconds * 10
+
+
 def net_datetime_to_py_datetime(net_datetime):
     return datetime(net_datetime.Year, net_datetime.Month, net_datetime.Day, net_datetime.Hour, net_datetime.Minute,
                     net_datetime.Second, net_datetime.Millisecond * 1000)
@@ -74,20 +104,39 @@ def net_time_period_to_pandas_period(net_time_period, freq):
 
 def series_to_double_time_series(series, time_period_type):
     """Converts an instance of pandas Series to a Cmdty.TimeSeries.TimeSeries type with Double data type."""
-    return series_to_time_series(series, time_period_type, dotnet.Double, lambda x: x)
+    net_indices = index_to_net_time_periods(series.index, time_period_type)
+    # Copy all values in a single memmove, rather than marshalling element-by-element across the CLR boundary
+    net_values = as_net_array(np.ascontiguousarray(series.to_numpy(), dtype=np.float64))
+    return ts.TimeSeries[time_period_type, dotnet.Double](net_indices, net_values)
 
 
 def series_to_time_series(series, time_period_type, net_data_type, data_selector):
     """Converts an instance of pandas Series to a Cmdty.TimeSeries.TimeSeries."""
-    series_len = len(series)
-    net_indices = dotnet.Array.CreateInstance(time_period_type, series_len)
-    net_values = dotnet.Array.CreateInstance(net_data_type, series_len)
+    net_indices = index_to_net_time_periods(series.index, time_period_type)
+    net_values = dotnet.Array.CreateInstance(net_data_type, len(series))
+    for i, value in enumerate(series.values):
+        net_values[i] = data_selector(value)
+    return ts.TimeSeries[time_period_type, net_data_type](net_indices, net_values)
 
-    for i in range(series_len):
-        net_indices[i] = from_datetime_like(series.index[i], time_period_type)
-        net_values[i] = data_selector(series.values[i])
 
-    return ts.TimeSeries[time_period_type, net_data_type](net_indices, net_values)
+def index_to_net_time_periods(index, time_period_type):
+    """Converts an instance of pandas Index to a .NET array of Time Period types."""
+    net_indices = dotnet.Array.CreateInstance(time_period_type, len(index))
+    from_date_time = _from_date_time_factory(time_period_type)
+    if isinstance(index, pd.PeriodIndex):
+        # Extract the date components as plain int lists upfront, so the loop below does no
+        # attribute lookup or boxing of pandas Period objects on each iteration
+        years = index.year.tolist()
+        months = index.month.tolist()
+        days = index.day.tolist()
+        hours = index.hour.tolist()
+        minutes = index.minute.tolist()
+        for i in range(len(index)):
+            net_indices[i] = from_date_time(dotnet.DateTime(years[i], months[i], days[i], hours[i], minutes[i], 0))
+    else:
+        for i, idx in enumerate(index):
+            net_indices[i] = from_datetime_like(idx, time_period_type)
+    return net_indices
 
 
 def net_time_series_to_pandas_series(net_time_series, freq):
@@ -97,7 +146,15 @@ def net_time_series_to_pandas_series(net_time_series, freq):
     curve_start = net_time_series.Indices[0].Start
     curve_start_datetime = net_datetime_to_py_datetime(curve_start)
     index = pd.period_range(start=curve_start_datetime, freq=freq, periods=net_time_series.Count)
-    prices = [net_time_series.Data[idx] for idx in range(0, net_time_series.Count)]
+    data = net_time_series.Data
+    if isinstance(data, dotnet.Array):
+        # Data is backed by a managed array, so copy it across the CLR boundary with the single
+        # pinned memmove in as_numpy_array
+        prices = as_numpy_array(data)
+    else:
+        # Otherwise np.fromiter fills the array in a single C-level pass, rather than fetching and
+        # re-boxing each element with a .NET indexer call per item
+        prices = np.fromiter(data, dtype=np.float64, count=net_time_series.Count)
     return pd.Series(prices, index)
 
 
@@ -133,15 +190,32 @@ The values are the associated .NET time period types used in behind-the-scenes c
 """
 
 
-def wrap_settle_for_dotnet(py_settle_func, freq):
-    def wrapper_settle_function(py_function, net_time_period, freq):
-        pandas_period = net_time_period_to_pandas_period(net_time_period, freq)
-        py_function_result = py_function(pandas_period)
-        net_settle_day = from_datetime_like(py_function_result, net_tp.Day)
-        return net_settle_day
+_NET_UNIX_EPOCH_TICKS = 621355968000000000
+
+
+def wrap_settle_for_dotnet(py_settle_func, freq, periods=None):
+    settle_day_cache = {}
+    if isinstance(periods, pd.PeriodIndex):
+        # The delivery periods are known upfront, so evaluate the settlement rule for all of them
+        # in one batch. The Ticks cache keys are derived from the period start times with a single
+        # array calculation, so no .NET DateTime property accesses are needed to seed the cache.
+        tick_keys = periods.start_time.asi8 // 100 + _NET_UNIX_EPOCH_TICKS
+        for cache_key, pandas_period in zip(tick_keys.tolist(), periods):
+            settle_day_cache[cache_key] = from_datetime_like(py_settle_func(pandas_period), net_tp.Day)
 
     def wrapped_function(net_time_period):
-        return wrapper_settle_function(py_settle_func, net_time_period, freq)
+        # The settlement rule is invoked from .NET once per cash flow, so the same period comes
+        # through many times during a valuation. Cache the result keyed on the period start Ticks
+        # integer, avoiding the pandas Period construction (allocation plus hashing) and the call
+        # into the Python settlement function on all but the first lookup for each period.
+        cache_key = net_time_period.Start.Ticks
+        net_settle_day = settle_day_cache.get(cache_key)
+        if net_settle_day is None:
+            pandas_period = net_time_period_to_pandas_period(net_time_period, freq)
+            py_function_result = py_settle_func(pandas_period)
+            net_settle_day = from_datetime_like(py_function_result, net_tp.Day)
+            settle_day_cache[cache_key] = net_settle_day
+        return net_settle_day
 
     time_period_type = FREQ_TO_PERIOD_TYPE[freq]
     return dotnet.Func[time_period_type, net_tp.Day](wrapped_function)
@@ -168,9 +242,17 @@ FwdContractsType = tp.Iterable[FwdContractType]
 def curve_to_net_dict(curve: CurveType, time_period_type):
     """Creates a .NET Dictionary<T, Double> instance from a Python curve, with type defined by CurveType."""
     ret = dotnet_cols_gen.Dictionary[time_period_type, dotnet.Double]()
-    for key in curve.keys():
-        net_key = from_datetime_like(key, time_period_type)
-        ret.Add(net_key, curve[key])
+    if isinstance(curve, pd.Series) and isinstance(curve.index, pd.PeriodIndex):
+        # Batch-convert the keys from the int date components of the PeriodIndex, so only the
+        # Add calls remain in the per-element loop
+        net_keys = index_to_net_time_periods(curve.index, time_period_type)
+        values = curve.to_numpy(dtype=np.float64).tolist()
+        for net_key, value in zip(net_keys, values):
+            ret.Add(net_key, value)
+    else:
+        for key in curve.keys():
+            net_key = from_datetime_like(key, time_period_type)
+            ret.Add(net_key, curve[key])
     return ret
 
 
@@ -315,8 +397,12 @@ def numerics_provider() -> str:
 def net_panel_to_data_frame(net_panel, freq: str) -> pd.DataFrame:
     np_array = as_numpy_array(net_panel.RawData)
     np_array.resize((net_panel.NumRows, net_panel.NumCols))
-    sim_periods = [net_time_period_to_pandas_period(p, freq) for p in net_panel.RowKeys]
-    period_index = pd.PeriodIndex(data=sim_periods, freq=freq)
+    if net_panel.NumRows == 0:
+        return pd.DataFrame(data=np_array, index=pd.PeriodIndex([], freq=freq))
+    # The panel row keys are contiguous periods, so only the first needs converting from .NET,
+    # with the rest of the index generated by pandas from the period ordinals
+    first_period = net_time_period_to_pandas_period(net_panel.RowKeys[0], freq)
+    period_index = pd.period_range(start=first_period, freq=freq, periods=net_panel.NumRows)
     return pd.DataFrame(data=np_array, index=period_index)
 
 
@@ -27,6 +27,7 @@ using System;
 using System.Collections.Generic;
 using System.Globalization;
 using System.Linq;
+using System.Threading.Tasks;
 using Cmdty.Core.Common;
 using Cmdty.Core.Simulation;
 using Cmdty.TimePeriodValueTypes;
@@ -167,14 +168,15 @@ namespace Cmdty.Storage
                 if (period.Equals(lsmcParams.CurrentPeriod))
                 {
                     currentPeriodContinuationValues = new double[nextPeriodInventorySpaceGrid.Length];
-                    // Current period, for which the price isn't random so expected storage values are just the average of the values for all sims
-                    for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++) // TODO parallelise?
+                    // Current period, for which the price isn't random so expected storage values are just the average of the values for all sims.
+                    // Iterations are independent as each writes to a distinct index, so can run in parallel.
+                    Parallel.For(0, nextPeriodInventorySpaceGrid.Length, i =>
                     {
                         Vector<double> storageValuesBySimNextPeriod = storageActualValuesNextPeriod[i];
                         double expectedStorageValueNextPeriod = storageValuesBySimNextPeriod.Average();
                         storageRegressValuesNextPeriod[i] = Vector<double>.Build.Dense(numSims, expectedStorageValueNextPeriod); // TODO this is a bit inefficent, review
                         currentPeriodContinuationValues[i] = expectedStorageValueNextPeriod;
-                    }
+                    });
                 }
                 else
                 {
@@ -185,7 +187,9 @@ namespace Cmdty.Storage
 
                     var thisPeriodRegressCoeffs = new Panel<int, double>(Enumerable.Range(0, nextPeriodInventorySpaceGrid.Length), basisFunctionList.Count);
                     // TODO doing the regressions for all next inventory could be inefficient as they might not all be needed
-                    for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++) // TODO parallelise?
+                    // Regress each next-period inventory grid point in parallel. The matrix reads are shared, but each
+                    // iteration only writes to its own array index and Panel row so no synchronisation is needed.
+                    Parallel.For(0, nextPeriodInventorySpaceGrid.Length, i =>
                     {
                         Vector<double> storageValuesBySimNextPeriod = storageActualValuesNextPeriod[i];
                         Vector<double> regressResults = pseudoInverse.Multiply(storageValuesBySimNextPeriod);
@@ -195,7 +199,7 @@ namespace Cmdty.Storage
                         Span<double> regressCoeffsSpan = thisPeriodRegressCoeffs[i];
                         for (int j = 0; j < regressCoeffsSpan.Length; j++)
                             regressCoeffsSpan[j] = regressResults[j];
-                    }
+                    });
                     regressCoeffsBuilder.Add(period, thisPeriodRegressCoeffs); // Key for regressCoeffs is period of simulated prices/factors, i.e. the regressor, which is the period before the period of continuation value being approximated
                 }
                 
@@ -46,20 +46,22 @@ namespace Cmdty.Storage
         {
             if (stateSpaceLowerBound > stateSpaceUpperBound)
                 throw new ArgumentException($"Parameter {nameof(stateSpaceLowerBound)} value cannot be above parameter {nameof(stateSpaceUpperBound)} value");
-            
-            yield return stateSpaceLowerBound;
 
-            if (stateSpaceLowerBound < stateSpaceUpperBound)
-            {
-                double gridPoint = stateSpaceLowerBound;
-                do
-                {
-                    gridPoint += Spacing;
-                    double yieldValue = Math.Min(gridPoint, stateSpaceUpperBound);
-                    yield return yieldValue;
-                } while (gridPoint < stateSpaceUpperBound);
-            }
+            if (stateSpaceLowerBound >= stateSpaceUpperBound)
+                return new[] { stateSpaceLowerBound };
 
+            // Materialise the grid eagerly into a pre-sized collection. GetGridPoints is called once per
+            // backward induction step and the caller immediately converts to an array, so a lazy iterator
+            // just adds MoveNext and allocation overhead on a hot path.
+            int numGridPointsEstimate = (int)((stateSpaceUpperBound - stateSpaceLowerBound) / Spacing) + 2;
+            var gridPoints = new List<double>(numGridPointsEstimate) { stateSpaceLowerBound };
+            double gridPoint = stateSpaceLowerBound;
+            do
+            {
+                gridPoint += Spacing;
+                gridPoints.Add(Math.Min(gridPoint, stateSpaceUpperBound));
+            } while (gridPoint < stateSpaceUpperBound);
+            return gridPoints;
         }
 
         public static FixedSpacingStateSpaceGridCalc CreateForFixedNumberOfPointsOnGlobalInventoryRange<T>(
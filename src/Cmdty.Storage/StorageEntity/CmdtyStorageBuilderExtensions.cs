@@ -121,6 +121,47 @@ namespace Cmdty.Storage
             return addInjectionCost;
         }
 
+        /// <summary>
+        /// Creates inject/withdraw constraints from flat parallel arrays, grouping adjacent rows with
+        /// equal period ticks into a single constraint period. Intended for non-.NET callers, e.g. the
+        /// Python API, which can pass a large ratchet table as four bulk-copied arrays rather than
+        /// constructing the nested collections with an interop call per element.
+        /// </summary>
+        public static List<InjectWithdrawRangeByInventoryAndPeriod<T>> BuildInjectWithdrawRangesFromArrays<T>(
+            [NotNull] long[] periodTicks, [NotNull] double[] inventories, [NotNull] double[] minRates,
+            [NotNull] double[] maxRates)
+            where T : ITimePeriod<T>
+        {
+            if (periodTicks == null) throw new ArgumentNullException(nameof(periodTicks));
+            if (inventories == null) throw new ArgumentNullException(nameof(inventories));
+            if (minRates == null) throw new ArgumentNullException(nameof(minRates));
+            if (maxRates == null) throw new ArgumentNullException(nameof(maxRates));
+            if (inventories.Length != periodTicks.Length || minRates.Length != periodTicks.Length ||
+                maxRates.Length != periodTicks.Length)
+                throw new ArgumentException("Parameter arrays must all have the same length.");
+
+            var injectWithdrawRanges = new List<InjectWithdrawRangeByInventoryAndPeriod<T>>();
+            int i = 0;
+            while (i < periodTicks.Length)
+            {
+                long blockTicks = periodTicks[i];
+                int blockStart = i;
+                do
+                {
+                    i++;
+                } while (i < periodTicks.Length && periodTicks[i] == blockTicks);
+
+                var rangesByInventory = new InjectWithdrawRangeByInventory[i - blockStart];
+                for (int j = blockStart; j < i; j++)
+                    rangesByInventory[j - blockStart] = new InjectWithdrawRangeByInventory(inventories[j],
+                        new InjectWithdrawRange(minRates[j], maxRates[j]));
+
+                T period = TimePeriodFactory.FromDateTime<T>(new DateTime(blockTicks));
+                injectWithdrawRanges.Add(new InjectWithdrawRangeByInventoryAndPeriod<T>(period, rangesByInventory));
+            }
+            return injectWithdrawRanges;
+        }
+
         private static IAddInjectionCost<T> AddInjectWithdrawRanges<T>(
             IAddInjectWithdrawConstraints<T> builder,
             IEnumerable<InjectWithdrawRangeByInventoryAndPeriod<T>> injectWithdrawRanges, 
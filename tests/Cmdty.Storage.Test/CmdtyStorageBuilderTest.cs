@@ -23,7 +23,9 @@
 // OTHER DEALINGS IN THE SOFTWARE.
 #endregion
 
+using System;
 using System.Collections.Generic;
+using System.Linq;
 using Cmdty.TimePeriodValueTypes;
 using Xunit;
 
@@ -195,7 +197,45 @@ namespace Cmdty.Storage.Test
 
         }
 
+        [Fact]
+        public void BuildInjectWithdrawRangesFromArrays_GroupsRowsByPeriodTicks()
+        {
+            long[] periodTicks =
+            {
+                new DateTime(2019, 10, 1).Ticks, new DateTime(2019, 10, 1).Ticks,
+                new DateTime(2019, 10, 17).Ticks, new DateTime(2019, 10, 17).Ticks, new DateTime(2019, 10, 17).Ticks
+            };
+            double[] inventories = { 0.0, 1000.0, 0.0, 600.0, 1000.0 };
+            double[] minRates = { -44.85, -47.12, -130.0, -131.5, -133.2 };
+            double[] maxRates = { 56.8, 50.01, 133.06, 130.05, 129.9 };
+
+            List<InjectWithdrawRangeByInventoryAndPeriod<Day>> injectWithdrawRanges =
+                CmdtyStorageBuilderExtensions.BuildInjectWithdrawRangesFromArrays<Day>(periodTicks, inventories,
+                    minRates, maxRates);
+
+            Assert.Equal(2, injectWithdrawRanges.Count);
+            Assert.Equal(new Day(2019, 10, 1), injectWithdrawRanges[0].Period);
+            Assert.Equal(new Day(2019, 10, 17), injectWithdrawRanges[1].Period);
+
+            InjectWithdrawRangeByInventory[] firstPeriodRanges = injectWithdrawRanges[0].InjectWithdrawRanges.ToArray();
+            Assert.Equal(2, firstPeriodRanges.Length);
+            Assert.Equal(1000.0, firstPeriodRanges[1].Inventory);
+            Assert.Equal(-47.12, firstPeriodRanges[1].InjectWithdrawRange.MinInjectWithdrawRate);
+            Assert.Equal(50.01, firstPeriodRanges[1].InjectWithdrawRange.MaxInjectWithdrawRate);
+            Assert.Equal(3, injectWithdrawRanges[1].InjectWithdrawRanges.Count());
+        }
 
+        [Fact]
+        public void BuildInjectWithdrawRangesFromArrays_InconsistentArrayLengths_Throws()
+        {
+            long[] periodTicks = { new DateTime(2019, 10, 1).Ticks, new DateTime(2019, 10, 1).Ticks };
+            double[] inventories = { 0.0, 1000.0 };
+            double[] rates = { -44.85 };
+
+            Assert.Throws<ArgumentException>(() =>
+                CmdtyStorageBuilderExtensions.BuildInjectWithdrawRangesFromArrays<Day>(periodTicks, inventories,
+                    rates, rates));
+        }
 
     }
 }